@@ -51,3 +51,11 @@ def test_parse_check_non_integer():
 
 def test_parse_add_missing_text():
     assert todo_cli.parse_command("a") == {"action": "error", "message": "usage: a <text>"}
+
+
+def test_parse_pin_no_space_multi_digit():
+    assert todo_cli.parse_command("p12") == {"action": "pin", "index": 12}
+
+
+def test_parse_no_space_unknown_prefix():
+    assert todo_cli.parse_command("x12") == {"action": "error", "message": "unknown command"}
@@ -1,3 +1,4 @@
+import sqlite3
 import todo_cli
 from datetime import date
 
@@ -49,3 +50,59 @@ def test_pin_unpins_previous(db):
     statuses = {r["id"]: r["status"] for r in db.execute("SELECT id, status FROM todos").fetchall()}
     assert statuses[ids[0]] == "unchecked"
     assert statuses[ids[1]] == "pinned"
+
+
+def test_split_by_status(db):
+    todo_cli.add_todo(db, "a")
+    todo_cli.add_todo(db, "b")
+    todo_cli.add_todo(db, "c")
+    ids = [r["id"] for r in db.execute("SELECT id FROM todos ORDER BY id").fetchall()]
+    todo_cli.set_status(db, ids[0], "checked")
+    todo_cli.pin_todo(db, ids[2])
+    # pinned has the highest id, so it must be grouped ahead of rowid order
+    assert [r["text"] for r in todo_cli.get_todos(db)] == ["c", "b", "a"]
+    pinned, unchecked, checked = todo_cli.get_todos_by_status(db)
+    assert [r["text"] for r in pinned] == ["c"]
+    assert [r["text"] for r in unchecked] == ["b"]
+    assert [r["text"] for r in checked] == ["a"]
+
+
+def test_get_todos_checked_last(db):
+    todo_cli.add_todo(db, "first")
+    todo_cli.add_todo(db, "second")
+    todo_cli.add_todo(db, "third")
+    db.execute("UPDATE todos SET status='checked' WHERE text='first'")
+    rows = todo_cli.get_todos(db)
+    assert [r["text"] for r in rows] == ["second", "third", "first"]
+
+
+def test_pin_same_item_twice(db):
+    todo_cli.add_todo(db, "only")
+    row = db.execute("SELECT id FROM todos").fetchone()
+    todo_cli.pin_todo(db, row["id"])
+    todo_cli.pin_todo(db, row["id"])
+    assert db.execute("SELECT status FROM todos").fetchone()["status"] == "pinned"
+
+
+
+def test_outside_write_clears_cached_rows(tmp_path):
+    path = tmp_path / "todo.db"
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    todo_cli.init_db(conn)
+    app = todo_cli.App.__new__(todo_cli.App)
+    app.db = conn
+    app._items = None
+    app._data_version = app._read_data_version()
+    assert app._load_items() == []
+
+    other = sqlite3.connect(path)
+    other.execute("INSERT INTO todos (text, created_at) VALUES ('outside', '2026-01-01')")
+    other.commit()
+    other.close()
+
+    assert app._check_outside_writes() is True
+    assert app._items is None
+    assert app._check_outside_writes() is False
+    assert [r["text"] for r in app._load_items()] == ["outside"]
+    conn.close()
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
+
 import curses
-import re
 import sqlite3
 from datetime import date
 from pathlib import Path
-from typing import Optional
 
 # commands that take an integer index argument
 _INDEX_COMMANDS = {
@@ -21,6 +21,11 @@ def open_db() -> sqlite3.Connection:
     DB_DIR.mkdir(exist_ok=True)
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
+    # append writes to a log instead of copying pages into a rollback journal
+    conn.execute("PRAGMA journal_mode=WAL")
+    # with WAL a crash can lose the last commit but never corrupt the file,
+    # so skip the fsync on every commit and only sync at checkpoints
+    conn.execute("PRAGMA synchronous=NORMAL")
     init_db(conn)
     return conn
 
@@ -40,16 +45,22 @@ def init_db(conn: sqlite3.Connection) -> None:
 def add_todo(conn: sqlite3.Connection, text: str) -> int:
     cur = conn.execute(
         "INSERT INTO todos (text, status, created_at) VALUES (?, 'unchecked', ?)",
-        (text, date.today().strftime("%Y-%m-%d")),
+        (text, date.today().isoformat()),
     )
     conn.commit()
     return cur.lastrowid
 
 
+def get_todos_by_status(conn: sqlite3.Connection) -> tuple:
+    # rowid order comes straight off the table scan; grouping by status in
+    # python is linear and stable, so sqlite never has to sort
+    rows = conn.execute("SELECT * FROM todos ORDER BY id").fetchall()
+    return split_by_status(rows)
+
+
 def get_todos(conn: sqlite3.Connection) -> list:
-    return conn.execute(
-        "SELECT * FROM todos ORDER BY CASE status WHEN 'pinned' THEN 0 WHEN 'unchecked' THEN 1 ELSE 2 END, id"
-    ).fetchall()
+    pinned, unchecked, checked = get_todos_by_status(conn)
+    return pinned + unchecked + checked
 
 
 def set_status(conn: sqlite3.Connection, todo_id: int, status: str) -> None:
@@ -63,11 +74,26 @@ def delete_todo(conn: sqlite3.Connection, todo_id: int) -> None:
 
 
 def pin_todo(conn: sqlite3.Connection, todo_id: int) -> None:
-    conn.execute("UPDATE todos SET status='unchecked' WHERE status='pinned'")
-    conn.execute("UPDATE todos SET status='pinned' WHERE id=?", (todo_id,))
+    # unpin the previous item and pin the new one in a single statement
+    conn.execute(
+        "UPDATE todos SET status = CASE WHEN id=? THEN 'pinned' ELSE 'unchecked' END"
+        " WHERE status='pinned' OR id=?",
+        (todo_id, todo_id),
+    )
     conn.commit()
 
 
+def split_by_status(items: list) -> tuple:
+    """Partition items into (pinned, unchecked, checked) in a single pass."""
+    pinned, unchecked, checked = [], [], []
+    # look the bucket up by status instead of walking an if/elif chain;
+    # anything unexpected sorts with the checked items
+    buckets = {"pinned": pinned, "unchecked": unchecked}
+    for item in items:
+        buckets.get(item["status"], checked).append(item)
+    return pinned, unchecked, checked
+
+
 def parse_command(buf: str) -> dict:
     parts = buf.strip().split(None, 1)
     if not parts:
@@ -76,10 +102,10 @@ def parse_command(buf: str) -> dict:
     arg = parts[1] if len(parts) > 1 else ""
 
     # allow :p1, :rm2, etc. (no space between command and index)
-    if not arg:
-        m = re.match(r'^([a-z]+)(\d+)$', cmd)
-        if m and m.group(1) in _INDEX_COMMANDS:
-            cmd, arg = m.group(1), m.group(2)
+    if not arg and cmd[-1] in "0123456789":
+        name = cmd.rstrip("0123456789")
+        if name in _INDEX_COMMANDS:
+            cmd, arg = name, cmd[len(name):]
 
     if cmd == "q":
         return {"action": "quit"}
@@ -99,6 +125,8 @@ def parse_command(buf: str) -> dict:
 
 
 class App:
+    _WAVE_COLORS = (214, 208, 202, 196, 202, 208)  # amber→red→amber
+
     def __init__(self, stdscr: "curses.window") -> None:
         self.stdscr = stdscr
         self.db = open_db()
@@ -107,7 +135,12 @@ class App:
         self.command_buf = ""
         self.error = ""
         self._frame = 0
-        self._confirm_delete: Optional[tuple] = None  # (todo_id, text)
+        self._confirm_delete: tuple | None = None  # (todo_id, text)
+        self._items: list | None = None  # cached rows, cleared on every write
+        self._data_version = self._read_data_version()
+        self._groups: tuple = ([], [], [])  # (pinned, unchecked, checked), valid while _items is set
+        self._wave_pairs_ready = False
+        self._screen_size = (0, 0)  # (rows, cols), refreshed at the start of each draw
 
         curses.start_color()
         curses.use_default_colors()
@@ -119,23 +152,30 @@ class App:
         curses.init_pair(1, curses.COLOR_GREEN, -1)   # checked
         curses.init_pair(2, curses.COLOR_YELLOW, -1)  # pinned bracket
         curses.init_pair(3, curses.COLOR_RED, -1)     # error
+        self._bracket_attrs = {
+            "pinned": curses.color_pair(2),
+            "checked": curses.color_pair(1),
+        }
 
     def _wave_color(self, char_pos: int) -> int:
         # 256-color amber→red→amber wave. returns a curses color pair.
         # pairs 20+ reserved for wave colors to avoid clashing with pairs 1-8
-        wave_colors = [214, 208, 202, 196, 202, 208]  # amber→red→amber
+        # each pair maps to a fixed color, so they only need registering once
+        wave_colors = self._WAVE_COLORS
+        if not self._wave_pairs_ready:
+            for i, color_idx in enumerate(wave_colors):
+                curses.init_pair(20 + i, color_idx, -1)
+            self._wave_pairs_ready = True
         phase = (self._frame // 2 + char_pos * 2) % (len(wave_colors) * 3)
-        color_idx = wave_colors[phase % len(wave_colors)]
         pair_num = 20 + (phase % len(wave_colors))
-        curses.init_pair(pair_num, color_idx, -1)
         return curses.color_pair(pair_num)
 
     def _draw_separator(self, row: int, char: str = "─") -> None:
-        _, w = self.stdscr.getmaxyx()
+        _, w = self._screen_size
         self.stdscr.addstr(row, 0, char * (w - 1), curses.A_DIM)
 
     def _draw_item(self, screen_row: int, index: int, item: dict, selected: bool) -> None:
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._screen_size
         if screen_row >= h - 1:
             return
 
@@ -151,24 +191,17 @@ class App:
         else:
             self.stdscr.addstr(screen_row, 0, idx_str, curses.A_DIM)
 
-        # spaces before bracket drawn separately so cursor highlight covers only [ ] / [X]
-        self.stdscr.addstr(screen_row, 4, "  ", curses.A_NORMAL)
+        # cols 4-5 and 9-10 stay blank from erase() so cursor highlight covers only [ ] / [X]
         bracket = "[X]" if status == "checked" else "[ ]"
-        color = {
-            "pinned": curses.color_pair(2),
-            "checked": curses.color_pair(1),
-        }.get(status, curses.A_DIM)
+        color = self._bracket_attrs.get(status, curses.A_DIM)
         bracket_attr = color | curses.A_REVERSE if selected else color
         self.stdscr.addstr(screen_row, 6, bracket, bracket_attr)
-        self.stdscr.addstr(screen_row, 9, "  ", curses.A_NORMAL)
 
         # text column starts at col 11
         text_col = 11
         max_text = w - text_col - 14
         if status == "pinned":
-            for i, ch in enumerate(text):
-                if text_col + i >= w - 1:
-                    break
+            for i, ch in enumerate(text[:w - 1 - text_col]):
                 self.stdscr.addstr(screen_row, text_col + i, ch, self._wave_color(i))
         elif status == "checked":
             self.stdscr.addstr(screen_row, text_col, text[:max_text], curses.color_pair(1) | curses.A_DIM)
@@ -182,12 +215,11 @@ class App:
 
     def draw(self) -> None:
         self.stdscr.erase()
-        h, _ = self.stdscr.getmaxyx()
+        # the size can only change between frames, so query it once per draw
+        self._screen_size = self.stdscr.getmaxyx()
 
-        items = self._load_items()
-        pinned = [r for r in items if r["status"] == "pinned"]
-        unchecked = [r for r in items if r["status"] == "unchecked"]
-        checked = [r for r in items if r["status"] == "checked"]
+        self._load_items()
+        pinned, unchecked, checked = self._groups
 
         row = 0
         self.stdscr.addstr(row, 2, "TODO", curses.A_DIM)
@@ -222,7 +254,7 @@ class App:
         self.stdscr.refresh()
 
     def _draw_statusbar(self) -> None:
-        h, _ = self.stdscr.getmaxyx()
+        h, _ = self._screen_size
         if self._confirm_delete:
             _, text = self._confirm_delete
             msg = f"delete '{text}'? [y/N]"
@@ -237,6 +269,7 @@ class App:
         if self._confirm_delete:
             if key == ord("y"):
                 delete_todo(self.db, self._confirm_delete[0])
+                self._items = None
                 self.cursor = max(0, self.cursor - 1)
             self._confirm_delete = None
             return True
@@ -256,6 +289,7 @@ class App:
                 item = items[self.cursor]
                 new_status = "unchecked" if item["status"] == "checked" else "checked"
                 set_status(self.db, item["id"], new_status)
+                self._items = None
                 self._move_cursor_to_next_unchecked(self._load_items())
         elif key == curses.KEY_UP:
             self.cursor = max(0, self.cursor - 1)
@@ -294,6 +328,7 @@ class App:
 
         if cmd["action"] == "add":
             add_todo(self.db, cmd["text"])
+            self._items = None
             items = self._load_items()
             self.cursor = len(items) - 1
             return True
@@ -308,6 +343,7 @@ class App:
             todo = items[idx]
             if cmd["action"] == "pin":
                 pin_todo(self.db, todo["id"])
+                self._items = None
                 self.cursor = 0
             else:
                 self._confirm_delete = (todo["id"], todo["text"])
@@ -315,23 +351,50 @@ class App:
         return True
 
     def _move_cursor_to_next_unchecked(self, items: list) -> None:
-        active = [i for i, it in enumerate(items) if it["status"] in ("unchecked", "pinned")]
-        if not active:
-            self.cursor = 0
-            return
-        self.cursor = next((i for i in active if i >= self.cursor), active[-1])
+        # scan forward from the cursor, then fall back to the last active item
+        # searching from the end, so only the rows between are visited
+        active = ("unchecked", "pinned")
+        n = len(items)
+        forward = (i for i in range(self.cursor, n) if items[i]["status"] in active)
+        backward = (i for i in range(n - 1, -1, -1) if items[i]["status"] in active)
+        i = next(forward, None)
+        self.cursor = i if i is not None else next(backward, 0)
+
+    def _read_data_version(self) -> int:
+        return self.db.execute("PRAGMA data_version").fetchone()[0]
+
+    def _check_outside_writes(self) -> bool:
+        """Drop the cached rows if another connection has committed. Return True if so."""
+        version = self._read_data_version()
+        if version == self._data_version:
+            return False
+        self._data_version = version
+        self._items = None
+        return True
 
     def _load_items(self) -> list:
-        return get_todos(self.db)
+        if self._items is None:
+            self._groups = get_todos_by_status(self.db)
+            pinned, unchecked, checked = self._groups
+            self._items = pinned + unchecked + checked
+        return self._items
 
     def run(self) -> None:
         self.stdscr.timeout(100)
+        dirty = True
         while True:
             self._frame += 1
-            self.draw()
+            # only a pinned item animates; otherwise nothing changes until a key
+            # arrives or another connection writes
+            pinned = self._groups[0]
+            if dirty or pinned:
+                self.draw()
             key = self.stdscr.getch()
+            outside_write = self._check_outside_writes()
             if key == -1:
+                dirty = outside_write
                 continue
+            dirty = True
             if not self.handle_key(key):
                 break
 